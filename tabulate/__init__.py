@@ -3,11 +3,12 @@
 from collections import namedtuple
 from collections.abc import Iterable, Sized
 from html import escape as htmlescape
-from itertools import chain, zip_longest as izip_longest
-from functools import reduce, partial
+from itertools import chain, islice, zip_longest as izip_longest
+from functools import lru_cache, partial
 import io
 import re
 import math
+import sys
 import textwrap
 import dataclasses
 
@@ -21,7 +22,16 @@ def _is_file(f):
     return isinstance(f, io.IOBase)
 
 
-__all__ = ["tabulate", "tabulate_formats", "simple_separated_format"]
+def _numpy():
+    """Return the NumPy module if the application has already imported it.
+
+    NumPy is an optional speed-up for numeric columns; it is never imported
+    by tabulate itself, so that tables of plain Python data don't pay for it.
+    """
+    return sys.modules.get("numpy")
+
+
+__all__ = ["tabulate", "tabulate_formats", "simple_separated_format", "infer_schema"]
 try:
     from .version import version as __version__  # noqa: F401
 except ImportError:
@@ -41,6 +51,9 @@ _DEFAULT_MISSINGVAL = ""
 # depending on the formatter
 _DEFAULT_ALIGN = "default"
 
+# columns at least this long are measured with NumPy, if it is loaded
+_NUMPY_MIN_ROWS = 1000
+
 
 # if True, enable wide-character (CJK) support
 WIDE_CHARS_MODE = wcwidth is not None
@@ -114,12 +127,12 @@ def _pipe_segment_with_colons(align, colwidth):
     """Return a segment of a horizontal line with optional colons which
     indicate column's alignment (as in `pipe` output format)."""
     w = colwidth
-    if align in ["right", "decimal"]:
-        return ("-" * (w - 1)) + ":"
+    if align == "right" or align == "decimal":
+        return ":".rjust(w, "-")
     elif align == "center":
-        return ":" + ("-" * (w - 2)) + ":"
+        return ":" + ":".rjust(w - 1, "-")
     elif align == "left":
-        return ":" + ("-" * (w - 1))
+        return ":".ljust(w, "-")
     else:
         return "-" * w
 
@@ -778,6 +791,12 @@ _float_with_thousands_separators = re.compile(
     r"^(([+-]?[0-9]{1,3})(?:,([0-9]{3}))*)?(?(1)\.[0-9]*|\.[0-9]+)?$"
 )
 
+# Every string int() or float() can parse starts like this: optional whitespace
+# and sign, then a digit (or a point and a digit, Infinity, or NaN for floats).
+# Testing for these prefixes is much cheaper than a failed conversion.
+_int_prefix = re.compile(r"\s*[-+]?\d")
+_float_prefix = re.compile(r"\s*[-+]?(?:\d|\.\d|inf|nan)", re.IGNORECASE)
+
 
 def simple_separated_format(separator):
     """Construct a simple TableFormat with columns separated by a separator.
@@ -853,6 +872,8 @@ def _isnumber(string):
     >>> _isnumber("inf")
     True
     """
+    if isinstance(string, str) and not _float_prefix.match(string):
+        return False
     if not _isconvertible(float, string):
         return False
     elif isinstance(string, (str, bytes)) and (
@@ -869,11 +890,11 @@ def _isint(string, inttype=int):
     >>> _isint("123.45")
     False
     """
-    return (
-        type(string) is inttype
-        or isinstance(string, (bytes, str))
-        and _isconvertible(inttype, string)
-    )
+    if type(string) is inttype:
+        return True
+    if inttype is int and isinstance(string, str) and not _int_prefix.match(string):
+        return False
+    return isinstance(string, (bytes, str)) and _isconvertible(inttype, string)
 
 
 def _isbool(string):
@@ -925,6 +946,56 @@ def _type(string, has_invisible=True, numparse=True):
         return str
 
 
+def _type_and_value(string, has_invisible=True, numparse=True):
+    """Like _type(), but for strings and bytestrings only, and parse
+    numbers once: return the type and the parsed value of the number.
+
+    Colored numbers are returned as they are, their ANSI codes have
+    to be preserved by _format().
+
+    >>> _type_and_value("42")
+    (<class 'int'>, 42)
+    >>> _type_and_value("4.5")
+    (<class 'float'>, 4.5)
+    >>> _type_and_value('\x1b[31m42\x1b[0m')
+    (<class 'int'>, '\\x1b[31m42\\x1b[0m')
+    >>> _type_and_value("spam")
+    (<class 'str'>, 'spam')
+
+    """
+    plain = _strip_ansi(string) if has_invisible else string
+    if _isbool(plain):
+        return bool, string
+    if numparse and (not isinstance(plain, str) or _float_prefix.match(plain)):
+        is_colored = plain != string
+        if not isinstance(plain, str) or _int_prefix.match(plain):
+            try:
+                number = int(plain)
+            except (ValueError, TypeError):
+                pass
+            else:
+                try:
+                    float(number)  # formatted as a float in float columns
+                except OverflowError:  # too large, like float(plain) is inf
+                    return int, string
+                return int, string if is_colored else number
+        try:
+            number = float(plain)
+        except (ValueError, TypeError):
+            pass
+        else:
+            if not (math.isinf(number) or math.isnan(number)) or plain.lower() in [
+                "inf",
+                "-inf",
+                "nan",
+            ]:
+                return float, string if is_colored else number
+    if isinstance(string, bytes):
+        return bytes, string
+    else:
+        return str, string
+
+
 def _afterpoint(string):
     """Symbols after a decimal point, -1 if the string lacks the decimal point.
 
@@ -940,16 +1011,13 @@ def _afterpoint(string):
     2
 
     """
+    pos = string.rfind(".")
+    pos = max(string.rfind("e"), string.rfind("E")) if pos < 0 else pos
+    if pos < 0:
+        return -1  # no point, whether it is a number or not
+    # integers have neither a point nor an exponent, don't try to parse one
     if _isnumber(string) or _isnumber_with_thousands_separator(string):
-        if _isint(string):
-            return -1
-        else:
-            pos = string.rfind(".")
-            pos = string.lower().rfind("e") if pos < 0 else pos
-            if pos >= 0:
-                return len(string) - pos - 1
-            else:
-                return -1  # no point
+        return len(string) - pos - 1
     else:
         return -1  # not a number
 
@@ -961,8 +1029,7 @@ def _padleft(width, s):
     True
 
     """
-    fmt = "{0:>%ds}" % width
-    return fmt.format(s)
+    return s.rjust(width)
 
 
 def _padright(width, s):
@@ -972,8 +1039,7 @@ def _padright(width, s):
     True
 
     """
-    fmt = "{0:<%ds}" % width
-    return fmt.format(s)
+    return s.ljust(width)
 
 
 def _padboth(width, s):
@@ -982,9 +1048,13 @@ def _padboth(width, s):
     >>> _padboth(6, '\u044f\u0439\u0446\u0430') == ' \u044f\u0439\u0446\u0430 '
     True
 
+    Unlike str.center(), put the odd space on the right, like "{:^}" does:
+
+    >>> _padboth(5, 'ab')
+    ' ab  '
+
     """
-    fmt = "{0:^%ds}" % width
-    return fmt.format(s)
+    return s.rjust(len(s) + (width - len(s)) // 2).ljust(width)
 
 
 def _padnone(ignore_width, s):
@@ -1112,6 +1182,22 @@ def _flat_list(nested_list):
     return ret
 
 
+def _measure_widths(strings, width_fn=len):
+    """Widths of the strings, the smallest and the largest of them.
+
+    >>> _measure_widths(["a", "bbb", "cc"])
+    ([1, 3, 2], 1, 3)
+
+    """
+    np = _numpy()
+    if np is not None and len(strings) >= _NUMPY_MIN_ROWS:
+        # measured into an array instead of a list of boxed ints, reduced in C
+        widths = np.fromiter(map(width_fn, strings), dtype=np.intp, count=len(strings))
+        return widths.tolist(), int(widths.min()), int(widths.max())
+    widths = list(map(width_fn, strings))
+    return widths, min(widths), max(widths)
+
+
 def _align_column(
     strings,
     alignment,
@@ -1120,16 +1206,16 @@ def _align_column(
     enable_widechars=False,
     is_multiline=False,
 ):
-    """[string] -> [padded_string]"""
-    strings, padfn = _align_column_choose_padfn(strings, alignment, has_invisible)
+    """[string] -> ([padded_string], width of the padded strings)"""
     width_fn = _align_column_choose_width_fn(
         has_invisible, enable_widechars, is_multiline
     )
 
-    s_widths = list(map(width_fn, strings))
-    maxwidth = max(max(_flat_list(s_widths)), minwidth)
     # TODO: refactor column alignment in single-line and multiline modes
     if is_multiline:
+        strings, padfn = _align_column_choose_padfn(strings, alignment, has_invisible)
+        s_widths = list(map(width_fn, strings))
+        maxwidth = max(max(_flat_list(s_widths)), minwidth)
         if not enable_widechars and not has_invisible:
             padded_strings = [
                 "\n".join([padfn(maxwidth, s) for s in ms.splitlines()])
@@ -1148,38 +1234,91 @@ def _align_column(
                 "\n".join([padfn(w, s) for s, w in zip((ms.splitlines() or ms), mw)])
                 for ms, mw in zip(strings, visible_widths)
             ]
+        # lines are split differently than measured, measure the padded lines
+        maxwidth = max(max(width_fn(ms)) for ms in set(padded_strings))
+    elif alignment == "decimal":
+        # find decimal points and measure visible widths in a single pass,
+        # once per distinct value: columns tend to repeat the same values
+        measured = {}
+        for s in strings:
+            if s not in measured:
+                plain = _strip_ansi(s) if has_invisible else s
+                measured[s] = (_afterpoint(plain), width_fn(s))
+        maxdecimals = max(decs for decs, _ in measured.values())
+        widest = max(w for _, w in measured.values())
+        if all(decs == maxdecimals for decs, _ in measured.values()):
+            # e.g. integers only, no trailing spaces are needed
+            maxwidth = max(widest, minwidth)
+            if all(w == maxwidth for _, w in measured.values()):
+                return strings, maxwidth
+            padded = {s: (maxwidth - w) * " " + s for s, (_, w) in measured.items()}
+        else:
+            # widths with the trailing spaces, which don't make up for strings
+            # wcswidth() can't measure (-1)
+            t_widths = {
+                s: w + maxdecimals - decs if w >= 0 else w
+                for s, (decs, w) in measured.items()
+            }
+            maxwidth = max(max(t_widths.values()), minwidth)
+            # visible widths are used, no correction for invisible characters
+            padded = {
+                s: (maxwidth - t_widths[s]) * " " + s + (maxdecimals - decs) * " "
+                for s, (decs, _) in measured.items()
+            }
+        padded_strings = [padded[s] for s in strings]
+        if widest < 0:  # wcswidth() can't measure them, padded or not
+            maxwidth = widest
     else:  # single-line cell values
+        strings, padfn = _align_column_choose_padfn(strings, alignment, has_invisible)
         if not enable_widechars and not has_invisible:
+            _, minlen, maxlen = _measure_widths(strings)
+            maxwidth = max(maxlen, minwidth)
+            if minlen == maxwidth:  # e.g. booleans, no padding is needed
+                return strings, maxwidth
             padded_strings = [padfn(maxwidth, s) for s in strings]
+            if padfn is _padnone:  # not padded to minwidth
+                maxwidth = maxlen
         else:
-            # enable wide-character width corrections
-            s_lens = list(map(len, strings))
-            visible_widths = [maxwidth - (w - l) for w, l in zip(s_widths, s_lens)]
-            # wcswidth and _visible_width don't count invisible characters;
-            # padfn doesn't need to apply another correction
-            padded_strings = [padfn(w, s) for s, w in zip(strings, visible_widths)]
-    return padded_strings
-
-
-def _more_generic(type1, type2):
-    types = {
-        type(None): 0,
-        bool: 1,
-        int: 2,
-        float: 3,
-        bytes: 4,
-        str: 5,
-    }
-    invtypes = {
-        5: str,
-        4: bytes,
-        3: float,
-        2: int,
-        1: bool,
-        0: type(None),
-    }
-    moregeneric = max(types.get(type1, 5), types.get(type2, 5))
-    return invtypes[moregeneric]
+            # enable wide-character width corrections:
+            # wcswidth and _visible_width don't count invisible characters,
+            # pad by the number of missing visible characters instead;
+            # the widths are costly to measure, do it once per distinct value
+            unique = list(dict.fromkeys(strings))
+            u_widths, minw, maxw = _measure_widths(unique, width_fn)
+            maxwidth = max(maxw, minwidth)
+            if minw == maxwidth:
+                return strings, maxwidth
+            pads = [maxwidth - w for w in u_widths]
+            padded = dict(zip(unique, _pad_by_counts(unique, pads, padfn)))
+            padded_strings = [padded[s] for s in strings]
+            if padfn is _padnone or maxw < 0:
+                # not padded to minwidth, or not measurable by wcswidth()
+                maxwidth = maxw
+    return padded_strings, maxwidth
+
+
+def _pad_by_counts(strings, pads, padfn):
+    """Add the given number of spaces to every string, distributed
+    the same way as padfn does.
+
+    >>> _pad_by_counts(["a", "bb"], [3, 0], _padboth)
+    [' a  ', 'bb']
+
+    """
+    if padfn is _padleft:
+        return [" " * p + s for s, p in zip(strings, pads)]
+    elif padfn is _padright:
+        return [s + " " * p for s, p in zip(strings, pads)]
+    elif padfn is _padboth:
+        return [" " * (p // 2) + s + " " * (p - p // 2) for s, p in zip(strings, pads)]
+    else:
+        return [padfn(len(s) + p, s) for s, p in zip(strings, pads)]
+
+
+# column types from the least to the most generic
+_ranked_types = [type(None), bool, int, float, bytes, str]
+_type_ranks = {t: rank for rank, t in enumerate(_ranked_types)}
+_str_rank = _type_ranks[str]
 
 
 def _column_type(strings, has_invisible=True, numparse=True):
@@ -1204,8 +1343,67 @@ def _column_type(strings, has_invisible=True, numparse=True):
     True
 
     """
-    types = [_type(s, has_invisible, numparse) for s in strings]
-    return reduce(_more_generic, types, bool)
+    return _infer_column(strings, has_invisible, numparse)[0]
+
+
+def _infer_column(strings, has_invisible=True, numparse=True):
+    """The least generic type of the column and the column values,
+    with numeric strings replaced by the parsed numbers.
+
+    Every distinct string value is classified and parsed only once.
+    The scan stops at the first value of the most generic type, str;
+    the values of str columns are returned as they are.
+
+    >>> _infer_column(["1", "2.5", "1"])
+    (<class 'float'>, [1, 2.5, 1])
+    >>> _infer_column(["1", None, "eggs"])
+    (<class 'str'>, ['1', None, 'eggs'])
+
+    """
+    if numparse:
+        inferred = _infer_column_np(strings)
+        if inferred is not None:
+            return inferred
+    rank = _type_ranks[bool]
+    values = []
+    seen = {}  # string value -> (type, parsed value)
+    for s in strings:
+        if isinstance(s, (str, bytes)):
+            try:
+                valtype, value = seen[s]
+            except KeyError:
+                valtype, value = seen[s] = _type_and_value(s, has_invisible, numparse)
+        else:
+            valtype, value = _type(s, has_invisible, numparse), s
+        valrank = _type_ranks.get(valtype, _str_rank)
+        if valrank > rank:
+            if valrank == _str_rank:
+                return str, strings
+            rank = valrank
+        values.append(value)
+    return _ranked_types[rank], values
+
+
+def _infer_column_np(strings):
+    """Convert a column of numbers to floats with NumPy in one go.
+
+    Return (float, values) if the column values are numbers which NumPy
+    converts to a float array, or None if NumPy has not been imported
+    or the column has to be inspected value by value.
+
+    """
+    numpy = _numpy()
+    if numpy is None or not strings:
+        return None
+    if not isinstance(strings[0], (float, numpy.floating)):
+        return None  # not a float column, don't waste time converting it
+    try:
+        arr = numpy.asarray(strings)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if arr.ndim != 1 or arr.dtype.kind != "f":
+        return None
+    return float, arr.tolist()
 
 
 def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
@@ -1244,6 +1442,42 @@ def _format(val, valtype, floatfmt, intfmt, missingval="", has_invisible=True):
         return f"{val}"
 
 
+def _choose_format_fn(valtype, floatfmt, intfmt, missingval="", has_invisible=True):
+    """Return a function to format the values of a column of type valtype
+    like _format() does, checking the type only once per column.
+
+    >>> format_fn = _choose_format_fn(float, ".2f", "", "?", False)
+    >>> [format_fn(v) for v in [1, "2.5", None]]
+    ['1.00', '2.50', '?']
+
+    """
+    if valtype is int:
+
+        def format_fn(val):
+            return missingval if val is None else format(val, intfmt)
+
+    elif valtype is float and not has_invisible:
+
+        def format_fn(val):
+            return missingval if val is None else format(float(val), floatfmt)
+
+    elif valtype is float or valtype is bytes:  # special cases are left to _format
+        format_fn = partial(
+            _format,
+            valtype=valtype,
+            floatfmt=floatfmt,
+            intfmt=intfmt,
+            missingval=missingval,
+            has_invisible=has_invisible,
+        )
+    else:
+
+        def format_fn(val):
+            return missingval if val is None else f"{val}"
+
+    return format_fn
+
+
 def _align_header(
     header, alignment, width, visible_width, is_multiline=False, width_fn=None
 ):
@@ -1575,6 +1809,8 @@ def tabulate(
     rowalign=None,
     maxheadercolwidths=None,
     gutter=None,
+    coltypes=None,
+    file=None,
 ):
     """Format a fixed width table for pretty printing.
 
@@ -2026,6 +2262,25 @@ def tabulate(
     e.g. `disable_numparse=[0, 2]` would disable number parsing only on the
     first and third columns.
 
+
+    Column types
+    ------------
+    The type of every column is inferred from its values. To skip it, e.g.
+    when printing many tables of the same shape, pass `coltypes`, a list
+    of types (`int`, `float`, `str`, ...), one per column. `None` or
+    omitting a type infers the type of that column. The values are
+    formatted as values of the given type, it is up to the caller to make
+    sure that they are. `infer_schema()` returns the types `tabulate`
+    would infer with the same `headers`, `tablefmt`, `showindex` and
+    `disable_numparse` arguments:
+
+    >>> types = infer_schema([["spam", 41.9999], ["eggs", "451.0"]])
+    >>> print(tabulate([["bacon", 4.5], ["ham", "1.25"]], coltypes=types))
+    -----  ----
+    bacon  4.5
+    ham    1.25
+    -----  ----
+
     Column Widths and Auto Line Wrapping
     ------------------------------------
     Tabulate will, by default, set the width of each column to the length of the
@@ -2051,6 +2306,21 @@ def tabulate(
 
     Header column width can be specified in a similar way using `maxheadercolwidth`
 
+
+    Output to a file
+    ----------------
+    To write a large table without building it as a single string, pass
+    a text file (or any object with a `write` method) as `file`. The lines
+    of the table are written to it as they are formatted, each followed by
+    a newline like `print` does, and `tabulate` returns None:
+
+    >>> import sys
+    >>> tabulate([["spam", 41.9999], ["eggs", "451.0"]], file=sys.stdout)
+    ----  --------
+    spam   41.9999
+    eggs  451
+    ----  --------
+
     """
 
     if tabular_data is None:
@@ -2138,7 +2408,6 @@ def tabulate(
     # format rows and columns, convert numeric values to strings
     cols = list(izip_longest(*list_of_lists))
     numparses = _expand_numparse(disable_numparse, len(cols))
-    coltypes = [_column_type(col, numparse=np) for col, np in zip(cols, numparses)]
     if isinstance(floatfmt, str):  # old version
         float_formats = len(cols) * [
             floatfmt
@@ -2161,54 +2430,109 @@ def tabulate(
         missing_vals = list(missingval)
         if len(missing_vals) < len(cols):
             missing_vals.extend((len(cols) - len(missing_vals)) * [_DEFAULT_MISSINGVAL])
-    cols = [
-        [_format(v, ct, fl_fmt, int_fmt, miss_v, has_invisible) for v in c]
-        for c, ct, fl_fmt, int_fmt, miss_v in zip(
-            cols, coltypes, float_formats, int_formats, missing_vals
-        )
-    ]
-
-    # align columns
-    aligns = [numalign if ct in [int, float] else stralign for ct in coltypes]
     if colalign is not None:
         assert isinstance(colalign, Iterable)
-        for idx, align in enumerate(colalign):
-            aligns[idx] = align
+        colalign = list(colalign)
+    else:
+        colalign = []
     minwidths = (
         [width_fn(h) + min_padding for h in headers] if headers else [0] * len(cols)
     )
-    cols = [
-        _align_column(c, a, minw, has_invisible, enable_widechars, is_multiline)
-        for c, a, minw in zip(cols, aligns, minwidths)
-    ]
+
+    coltypes = list(coltypes) if coltypes is not None else []
+
+    # infer the type, format and align every column in one go
+    aligns = []
+    aligned_cols = []
+    col_widths = []
+    for idx, (c, numparse, fl_fmt, int_fmt, miss_v, minw) in enumerate(
+        zip(cols, numparses, float_formats, int_formats, missing_vals, minwidths)
+    ):
+        if idx < len(coltypes) and coltypes[idx] is not None:
+            ct = coltypes[idx]  # given by the caller, no inference
+        else:
+            ct, values = _infer_column(c, numparse=numparse)
+            if ct is float:  # format the numbers parsed by _infer_column
+                c = values
+        format_fn = _choose_format_fn(ct, fl_fmt, int_fmt, miss_v, has_invisible)
+        formatted = list(map(format_fn, c))
+        if idx < len(colalign):
+            align = colalign[idx]
+        else:
+            align = numalign if ct in [int, float] else stralign
+        aligns.append(align)
+        aligned, width = _align_column(
+            formatted, align, minw, has_invisible, enable_widechars, is_multiline
+        )
+        aligned_cols.append(aligned)
+        col_widths.append(width)
+    cols = aligned_cols
 
     if headers:
         # align headers and add headers
-        t_cols = cols or [[""]] * len(headers)
+        t_widths = col_widths or [0] * len(headers)
         t_aligns = aligns or [stralign] * len(headers)
-        minwidths = [
-            max(minw, max(width_fn(cl) for cl in c))
-            for minw, c in zip(minwidths, t_cols)
-        ]
+        minwidths = [max(minw, w) for minw, w in zip(minwidths, t_widths)]
         headers = [
             _align_header(h, a, minw, width_fn(h), is_multiline, width_fn)
             for h, a, minw in zip(headers, t_aligns, minwidths)
         ]
-        rows = list(zip(*cols))
     else:
-        minwidths = [max(width_fn(cl) for cl in c) for c in cols]
-        rows = list(zip(*cols))
+        minwidths = col_widths
 
     if not isinstance(tablefmt, TableFormat):
         tablefmt = _table_formats.get(tablefmt, _table_formats["simple"])
 
+    nrows = len(cols[0]) if cols else 0
     ra_default = rowalign if isinstance(rowalign, str) else None
-    rowaligns = _expand_iterable(rowalign, len(rows), ra_default)
-    _reinsert_separating_lines(rows, separating_lines)
+    rowaligns = _expand_iterable(rowalign, nrows, ra_default)
 
     return _format_table(
-        tablefmt, headers, rows, minwidths, aligns, is_multiline, rowaligns=rowaligns
+        tablefmt,
+        headers,
+        cols,
+        minwidths,
+        aligns,
+        is_multiline,
+        rowaligns=rowaligns,
+        separating_lines=separating_lines,
+        file=file,
+    )
+
+
+def infer_schema(
+    tabular_data,
+    headers=(),
+    tablefmt="simple",
+    showindex="default",
+    disable_numparse=False,
+):
+    """Column types which tabulate() infers for tabular_data.
+
+    The types can be passed back to tabulate() as `coltypes` to skip the
+    inference for tables of the same shape. The arguments are those of
+    tabulate(); the table format matters as "pretty" tables don't parse
+    numbers.
+
+    >>> infer_schema([["spam", 1, "2.5"], ["eggs", 42, None]])
+    [<class 'str'>, <class 'int'>, <class 'float'>]
+    >>> infer_schema([["spam", 1, "2.5"]], disable_numparse=[2])
+    [<class 'str'>, <class 'int'>, <class 'str'>]
+    >>> infer_schema([["spam", 1, "2.5"]], tablefmt="pretty")
+    [<class 'str'>, <class 'str'>, <class 'str'>]
+
+    """
+    if tabular_data is None:
+        tabular_data = []
+    if tablefmt == "pretty":  # like in tabulate()
+        disable_numparse = True
+    list_of_lists, _ = _normalize_tabular_data(
+        tabular_data, headers, showindex=showindex
     )
+    list_of_lists, _ = _remove_separating_lines(list_of_lists)
+    cols = list(izip_longest(*list_of_lists))
+    numparses = _expand_numparse(disable_numparse, len(cols))
+    return [_column_type(c, numparse=n) for c, n in zip(cols, numparses)]
 
 
 def _expand_numparse(disable_numparse, column_count):
@@ -2257,6 +2581,36 @@ def _build_simple_row(padded_cells, rowfmt):
     return (begin + sep.join(padded_cells) + end).rstrip()
 
 
+def _simple_row_builder(rowfmt, padding):
+    """Return a function which formats a row of cells according to DataRow
+    format, like _build_simple_row(_pad_row(cells, padding), rowfmt) does.
+
+    The padding is added to the separators, so the cells are not copied.
+    The functions are cached, tables of the same format reuse them.
+
+    >>> build_row = _simple_row_builder(DataRow("|", "|", "|"), 1)
+    >>> build_row(["spam", "eggs"])
+    '| spam | eggs |'
+
+    """
+    # custom formats may use any sequence, e.g. a list, as a DataRow
+    return _cached_simple_row_builder(tuple(rowfmt), padding)
+
+
+@lru_cache(maxsize=64)
+def _cached_simple_row_builder(rowfmt, padding):
+    begin, sep, end = rowfmt
+    pad = " " * padding
+    before, between, after = begin + pad, pad + sep + pad, pad + end
+
+    def build_row(cells):
+        if not cells:
+            return (begin + end).rstrip()
+        return f"{before}{between.join(cells)}{after}".rstrip()
+
+    return build_row
+
+
 def _build_row(padded_cells, colwidths, colaligns, rowfmt):
     "Return a string which represents a row of data cells."
     if not rowfmt:
@@ -2338,9 +2692,47 @@ class JupyterHTMLStr(str):
         return self
 
 
-def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowaligns):
-    """Produce a plain-text representation of the table."""
-    lines = []
+class _LineWriter:
+    """Write the lines appended to it to a file, each followed by a newline,
+    instead of keeping them like a list of lines does."""
+
+    def __init__(self, file):
+        self.write = file.write
+
+    def append(self, line):
+        self.write(line)
+        self.write("\n")
+
+
+def _format_table(
+    fmt,
+    headers,
+    cols,
+    colwidths,
+    colaligns,
+    is_multiline,
+    rowaligns,
+    separating_lines=None,
+    file=None,
+):
+    """Produce a plain-text representation of the table.
+
+    The rows are taken from the columns of cell values one at a time,
+    the separating lines are inserted at their original indices.
+    If file is given, the lines are written to it as they are produced,
+    and None is returned.
+    """
+    rows = zip(*cols)
+    if separating_lines:
+        rows = list(rows)
+        _reinsert_separating_lines(rows, separating_lines)
+        nrows = len(rows)
+    else:
+        nrows = len(cols[0]) if cols else 0
+    if not headers and not nrows:  # a completely empty table
+        return "" if file is None else None
+
+    lines = [] if file is None else _LineWriter(file)
     hidden = fmt.with_header_hide if (headers and fmt.with_header_hide) else []
     pad = fmt.padding
     headerrow = fmt.headerrow
@@ -2354,32 +2746,46 @@ def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowali
         append_row = _append_basic_row
 
     padded_headers = pad_row(headers, pad)
-    padded_rows = [pad_row(row, pad) for row in rows]
+    datarow = fmt.datarow
+    if not is_multiline and datarow and not hasattr(datarow, "__call__"):
+        # fold the padding into the separators instead of padding every cell
+        build_row = _simple_row_builder(datarow, pad)
+        data_rows = rows
+
+        def append_datarow(row, rowalign=None):
+            lines.append(build_row(row))
+
+        # the cells of padded rows never matched SEPARATING_LINE
+        is_separating_line = _is_separating_line if not pad else lambda row: False
+    else:
+        data_rows = (pad_row(row, pad) for row in rows)
+
+        def append_datarow(row, rowalign=None):
+            append_row(lines, row, padded_widths, colaligns, datarow, rowalign=rowalign)
+
+        is_separating_line = _is_separating_line
 
     if fmt.lineabove and "lineabove" not in hidden:
         _append_line(lines, padded_widths, colaligns, fmt.lineabove)
 
     if padded_headers:
-        append_row(lines, padded_headers, padded_widths, colaligns, headerrow)
+        if is_multiline or not headerrow or hasattr(headerrow, "__call__"):
+            append_row(lines, padded_headers, padded_widths, colaligns, headerrow)
+        else:
+            lines.append(_simple_row_builder(headerrow, pad)(headers))
         if fmt.linebelowheader and "linebelowheader" not in hidden:
             _append_line(lines, padded_widths, colaligns, fmt.linebelowheader)
 
-    if padded_rows and fmt.linebetweenrows and "linebetweenrows" not in hidden:
-        # initial rows with a line below
-        for row, ralign in zip(padded_rows[:-1], rowaligns):
-            append_row(
-                lines, row, padded_widths, colaligns, fmt.datarow, rowalign=ralign
-            )
-            _append_line(lines, padded_widths, colaligns, fmt.linebetweenrows)
+    if nrows and fmt.linebetweenrows and "linebetweenrows" not in hidden:
+        # initial rows with a line below, the same line every time
+        line_between = _build_line(padded_widths, colaligns, fmt.linebetweenrows)
+        for row, ralign in zip(islice(data_rows, nrows - 1), rowaligns):
+            append_datarow(row, rowalign=ralign)
+            lines.append(line_between)
         # the last row without a line below
-        append_row(
-            lines,
-            padded_rows[-1],
-            padded_widths,
-            colaligns,
-            fmt.datarow,
-            rowalign=rowaligns[-1],
-        )
+        for last_row in data_rows:  # normally there is only one row left
+            pass
+        append_datarow(last_row, rowalign=rowaligns[-1])
     else:
         separating_line = (
             fmt.linebetweenrows
@@ -2388,25 +2794,29 @@ def _format_table(fmt, headers, rows, colwidths, colaligns, is_multiline, rowali
             or fmt.lineabove
             or Line("", "", "", "")
         )
-        for row in padded_rows:
+        built_separating_line = None
+        for row in data_rows:
             # test to see if either the 1st column or the 2nd column (account for showindex) has
             # the SEPARATING_LINE flag
-            if _is_separating_line(row):
-                _append_line(lines, padded_widths, colaligns, separating_line)
+            if is_separating_line(row):
+                if built_separating_line is None:
+                    built_separating_line = _build_line(
+                        padded_widths, colaligns, separating_line
+                    )
+                lines.append(built_separating_line)
             else:
-                append_row(lines, row, padded_widths, colaligns, fmt.datarow)
+                append_datarow(row)
 
     if fmt.linebelow and "linebelow" not in hidden:
         _append_line(lines, padded_widths, colaligns, fmt.linebelow)
 
-    if headers or rows:
-        output = "\n".join(lines)
-        if fmt.lineabove == _html_begin_table_without_header:
-            return JupyterHTMLStr(output)
-        else:
-            return output
-    else:  # a completely empty table
-        return ""
+    if file is not None:
+        return None
+    output = "\n".join(lines)
+    if fmt.lineabove == _html_begin_table_without_header:
+        return JupyterHTMLStr(output)
+    else:
+        return output
 
 
 class _CustomTextWrap(textwrap.TextWrapper):
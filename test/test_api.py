@@ -2,7 +2,7 @@
 
 """
 
-from tabulate import tabulate, tabulate_formats, simple_separated_format
+from tabulate import tabulate, tabulate_formats, simple_separated_format, infer_schema
 from common import skip
 
 
@@ -53,6 +53,8 @@ def test_tabulate_signature():
         ("rowalign", None),
         ("maxheadercolwidths", None),
         ("gutter", None),
+        ("coltypes", None),
+        ("file", None),
     ]
     _check_signature(tabulate, expected_sig)
 
@@ -62,3 +64,16 @@ def test_simple_separated_format_signature():
     assert type(simple_separated_format) is type(lambda: None)  # noqa
     expected_sig = [("separator", _empty)]
     _check_signature(simple_separated_format, expected_sig)
+
+
+def test_infer_schema_signature():
+    "API: infer_schema() type signature is unchanged" ""
+    assert type(infer_schema) is type(lambda: None)  # noqa
+    expected_sig = [
+        ("tabular_data", _empty),
+        ("headers", ()),
+        ("tablefmt", "simple"),
+        ("showindex", "default"),
+        ("disable_numparse", False),
+    ]
+    _check_signature(infer_schema, expected_sig)
@@ -16,7 +16,7 @@ def test_multiline_width():
 def test_align_column_decimal():
     "Internal: _align_column(..., 'decimal')"
     column = ["12.345", "-1234.5", "1.23", "1234.5", "1e+234", "1.0e234"]
-    output = T._align_column(column, "decimal")
+    output, width = T._align_column(column, "decimal")
     expected = [
         "   12.345  ",
         "-1234.5    ",
@@ -26,12 +26,13 @@ def test_align_column_decimal():
         "    1.0e234",
     ]
     assert_equal(output, expected)
+    assert_equal(width, 11)
 
 
 def test_align_column_decimal_with_thousand_separators():
     "Internal: _align_column(..., 'decimal')"
     column = ["12.345", "-1234.5", "1.23", "1,234.5", "1e+234", "1.0e234"]
-    output = T._align_column(column, "decimal")
+    output, width = T._align_column(column, "decimal")
     expected = [
         "   12.345  ",
         "-1234.5    ",
@@ -41,12 +42,13 @@ def test_align_column_decimal_with_thousand_separators():
         "    1.0e234",
     ]
     assert_equal(output, expected)
+    assert_equal(width, 11)
 
 
 def test_align_column_decimal_with_incorrect_thousand_separators():
     "Internal: _align_column(..., 'decimal')"
     column = ["12.345", "-1234.5", "1.23", "12,34.5", "1e+234", "1.0e234"]
-    output = T._align_column(column, "decimal")
+    output, width = T._align_column(column, "decimal")
     expected = [
         "     12.345  ",
         "  -1234.5    ",
@@ -56,22 +58,39 @@ def test_align_column_decimal_with_incorrect_thousand_separators():
         "      1.0e234",
     ]
     assert_equal(output, expected)
+    assert_equal(width, 13)
+
+
+def test_align_column_decimal_unmeasurable_wide_chars():
+    "Internal: _align_column(..., 'decimal') with strings wcswidth() can't measure"
+    try:
+        import wcwidth  # noqa
+    except ImportError:
+        skip("test_align_column_decimal_unmeasurable_wide_chars is skipped")
+
+    column = ["1.5", "\r", "12.25"]
+    output, width = T._align_column(column, "decimal", enable_widechars=True)
+    expected = [" 1.5 ", "      \r   ", "12.25"]
+    assert_equal(output, expected)
+    assert_equal(width, 5)
 
 
 def test_align_column_none():
     "Internal: _align_column(..., None)"
     column = ["123.4", "56.7890"]
-    output = T._align_column(column, None)
+    output, width = T._align_column(column, None)
     expected = ["123.4", "56.7890"]
     assert_equal(output, expected)
+    assert_equal(width, 7)
 
 
 def test_align_column_multiline():
     "Internal: _align_column(..., is_multiline=True)"
     column = ["1", "123", "12345\n6"]
-    output = T._align_column(column, "center", is_multiline=True)
+    output, width = T._align_column(column, "center", is_multiline=True)
     expected = ["  1  ", " 123 ", "12345" + "\n" + "  6  "]
     assert_equal(output, expected)
+    assert_equal(width, 5)
 
 
 def test_align_cell_veritically_one_line_only():
@@ -343,3 +362,47 @@ def test__reinsert_separating_lines():
     expected = rows_to_pipe_table_str(with_rows)
 
     assert_equal(expected, rows_to_pipe_table_str(sans_rows))
+
+
+def test_infer_column():
+    "Internal: _infer_column() parses numbers once and keeps colored cells as is"
+    colored = "\x1b[31m1.5\x1b[0m"
+    column = ["1", "2.5", None, colored, b"3", "1"]
+    coltype, values = T._infer_column(column)
+    assert_equal(float, coltype)
+    assert_equal([1, 2.5, None, colored, 3, 1], values)
+
+
+def test_infer_column_np():
+    "Internal: _infer_column_np() converts float columns with NumPy"
+    try:
+        import numpy
+
+        column = (numpy.float32(0.5), 1.5, numpy.int64(3), True)
+        coltype, values = T._infer_column_np(column)
+        assert_equal(float, coltype)
+        assert_equal([0.5, 1.5, 3.0, 1.0], values)
+        assert_equal(None, T._infer_column_np((1.5, "2.5")))
+        assert_equal(None, T._infer_column_np((1.5, None)))
+        assert_equal(None, T._infer_column_np((1, 2)))
+    except ImportError:
+        skip("test_infer_column_np is skipped")
+
+
+def test_measure_widths_np():
+    "Internal: _measure_widths() measures long columns with NumPy"
+    try:
+        import numpy  # noqa
+
+        column = ["a" * (i % 7 + 1) for i in range(T._NUMPY_MIN_ROWS)]
+        widths, minwidth, maxwidth = T._measure_widths(column)
+        assert_equal([len(s) for s in column], widths)
+        assert_equal(1, minwidth)
+        assert_equal(7, maxwidth)
+        assert_equal(int, type(maxwidth))
+        column = ["\u4e2d" * (i % 3) for i in range(T._NUMPY_MIN_ROWS)]
+        widths, minwidth, maxwidth = T._measure_widths(column, lambda s: 2 * len(s))
+        assert_equal(0, minwidth)
+        assert_equal(4, maxwidth)
+    except ImportError:
+        skip("test_measure_widths_np is skipped")
@@ -2706,6 +2706,13 @@ def test_float_conversions():
     assert_equal(expected, result)
 
 
+def test_float_conversions_int_too_large():
+    "Output: integers too large for a float in a float column are inf"
+    result = tabulate([["1.5"], ["1" + "0" * 400], ["-1" + "0" * 400]])
+    expected = "\n".join(["------", "   1.5", " inf", "-inf", "------"])
+    assert_equal(expected, result)
+
+
 def test_missingval():
     "Output: substitution of missing values"
     result = tabulate(
@@ -2956,6 +2963,57 @@ def test_disable_numparse_list():
     assert_equal(expected, result)
 
 
+def test_coltypes():
+    "Output: column types given by the caller are not inferred"
+    table_headers = ["h1", "h2", "h3"]
+    test_table = [["foo", "bar", "42992e1"]]
+    expected = "\n".join(
+        ["h1    h2    h3", "----  ----  -------", "foo   bar   42992e1"]
+    )
+    result = tabulate(test_table, table_headers, coltypes=[None, None, str])
+    assert_equal(expected, result)
+
+
+def test_coltypes_infer_schema():
+    "Output: column types returned by infer_schema() give the same table"
+    schema = tabulate_module.infer_schema(_test_table)
+    expected = tabulate(_test_table, _test_table_headers)
+    result = tabulate(_test_table, _test_table_headers, coltypes=schema)
+    assert_equal(expected, result)
+
+
+def test_coltypes_infer_schema_pretty():
+    "Output: column types returned by infer_schema() for pretty tables"
+    table = [["a", 1.0], ["b", "2.50"]]
+    schema = tabulate_module.infer_schema(table, tablefmt="pretty")
+    expected = tabulate(table, tablefmt="pretty")
+    result = tabulate(table, tablefmt="pretty", coltypes=schema)
+    assert_equal(expected, result)
+
+
+def test_file():
+    "Output: the lines of the table are written to a file"
+    from io import StringIO
+
+    table = [["spam", "a\nb"], SEPARATING_LINE, ["eggs", 451]]
+    for tablefmt in ["simple", "grid", "html"]:
+        expected = tabulate(table, _test_table_headers, tablefmt=tablefmt) + "\n"
+        file = StringIO()
+        result = tabulate(table, _test_table_headers, tablefmt=tablefmt, file=file)
+        assert_equal(None, result)
+        assert_equal(expected, file.getvalue())
+
+
+def test_file_empty_table():
+    "Output: nothing is written to a file for a completely empty table"
+    from io import StringIO
+
+    file = StringIO()
+    result = tabulate([], tablefmt="grid", file=file)
+    assert_equal(None, result)
+    assert_equal("", file.getvalue())
+
+
 def test_preserve_whitespace():
     "Output: Default table output, but with preserved leading whitespace."
     tabulate_module.PRESERVE_WHITESPACE = True
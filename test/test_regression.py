@@ -447,6 +447,26 @@ def test_custom_tablefmt():
     assert_equal(result, expected)
 
 
+def test_custom_tablefmt_with_lists():
+    "Regression: allow custom TableFormat with rows formats given as lists"
+    tablefmt = TableFormat(
+        lineabove=None,
+        linebelowheader=["|", "-", "|", "|"],
+        linebetweenrows=None,
+        linebelow=None,
+        headerrow=["|", "|", "|"],
+        datarow=["|", "|", "|"],
+        padding=1,
+        with_header_hide=None,
+    )
+    rows = [["foo", "bar"], ["baz", "qux"]]
+    expected = "\n".join(
+        ["| A   | B   |", "|-----|-----|", "| foo | bar |", "| baz | qux |"]
+    )
+    result = tabulate(rows, headers=["A", "B"], tablefmt=tablefmt)
+    assert_equal(result, expected)
+
+
 def test_string_with_comma_between_digits_without_floatfmt_grouping_option():
     "Regression: accept commas in numbers-as-text when grouping is not defined (github issue #110)"
     table = [["126,000"]]